@@ -71,7 +71,7 @@ async def sse_client(
                     ):
                         try:
                             async for sse in event_source.aiter_sse():  # pragma: no branch
-                                logger.debug(f"Received SSE event: {sse.event}")
+                                logger.debug("Received SSE event: %s", sse.event)
                                 match sse.event:
                                     case "endpoint":
                                         endpoint_url = urljoin(url, sse.data)
@@ -96,7 +96,7 @@ async def sse_client(
                                             message = types.JSONRPCMessage.model_validate_json(  # noqa: E501
                                                 sse.data
                                             )
-                                            logger.debug(f"Received server message: {message}")
+                                            logger.debug("Received server message: %s", message)
                                         except Exception as exc:  # pragma: no cover
                                             logger.exception("Error parsing server message")  # pragma: no cover
                                             await read_stream_writer.send(exc)  # pragma: no cover
@@ -119,7 +119,7 @@ async def sse_client(
                         try:
                             async with write_stream_reader:
                                 async for session_message in write_stream_reader:
-                                    logger.debug(f"Sending client message: {session_message}")
+                                    logger.debug("Sending client message: %s", session_message)
                                     response = await client.post(
                                         endpoint_url,
                                         json=session_message.message.model_dump(
@@ -129,7 +129,7 @@ async def sse_client(
                                         ),
                                     )
                                     response.raise_for_status()
-                                    logger.debug(f"Client message sent successfully: {response.status_code}")
+                                    logger.debug("Client message sent successfully: %s", response.status_code)
                         except Exception:  # pragma: no cover
                             logger.exception("Error in post_writer")  # pragma: no cover
                         finally:
@@ -165,7 +165,7 @@ class StreamableHTTPTransport:
                 return False
             try:
                 message = JSONRPCMessage.model_validate_json(sse.data)
-                logger.debug(f"SSE message: {message}")
+                logger.debug("SSE message: %s", message)
 
                 # Extract protocol version from initialization response
                 if is_initialization:
@@ -391,7 +391,7 @@ class StreamableHTTPTransport:
                     # Check if this is a resumption request
                     is_resumption = bool(metadata and metadata.resumption_token)
 
-                    logger.debug(f"Sending client message: {message}")
+                    logger.debug("Sending client message: %s", message)
 
                     # Handle initialized notification
                     if self._is_initialized_notification(message):
@@ -169,7 +169,7 @@ class SseServerTransport:
                 logger.debug(f"Sent endpoint event: {client_post_uri_data}")
 
                 async for session_message in write_stream_reader:
-                    logger.debug(f"Sending message via SSE: {session_message}")
+                    logger.debug("Sending message via SSE: %s", session_message)
                     await sse_stream_writer.send(
                         {
                             "event": "message",
@@ -228,11 +228,11 @@ class SseServerTransport:
             return await response(scope, receive, send)
 
         body = await request.body()
-        logger.debug(f"Received JSON: {body}")
+        logger.debug("Received JSON: %s", body)
 
         try:
             message = types.JSONRPCMessage.model_validate_json(body)
-            logger.debug(f"Validated client message: {message}")
+            logger.debug("Validated client message: %s", message)
         except ValidationError as err:
             logger.exception("Failed to parse message")
             response = Response("Could not parse message", status_code=400)
@@ -243,7 +243,7 @@ class SseServerTransport:
         # Pass the ASGI scope for framework-agnostic access to request data
         metadata = ServerMessageMetadata(request_context=request)
         session_message = SessionMessage(message, metadata=metadata)
-        logger.debug(f"Sending session message to writer: {session_message}")
+        logger.debug("Sending session message to writer: %s", session_message)
         response = Response("Accepted", status_code=202)
         await response(scope, receive, send)
         await writer.send(session_message)
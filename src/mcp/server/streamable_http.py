@@ -430,7 +430,7 @@ class StreamableHTTPServerTransport:
                             break
                         # For notifications and request, keep waiting
                         else:
-                            logger.debug(f"received: {event_message.message.root.method}")
+                            logger.debug("received: %s", event_message.message.root.method)
 
                     # At this point we should have a response
                     if response_message:
@@ -875,7 +875,7 @@ class StreamableHTTPServerTransport:
                         event_id = None
                         if self._event_store:
                             event_id = await self._event_store.store_event(request_stream_id, message)
-                            logger.debug(f"Stored {event_id} from {request_stream_id}")
+                            logger.debug("Stored %s from %s", event_id, request_stream_id)
 
                         if request_stream_id in self._request_streams:
                             try: